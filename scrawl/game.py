@@ -53,6 +53,12 @@ class PGZeroGame:
         pygame.KEYUP: 'on_key_up',
     }
 
+    MOUSE_EVENTS = (
+        pygame.MOUSEBUTTONDOWN,
+        pygame.MOUSEBUTTONUP,
+        pygame.MOUSEMOTION,
+    )
+
     def load_handlers(self):
         self.handlers = {}
         for type, name in self.EVENT_HANDLERS.items():
@@ -60,6 +66,15 @@ class PGZeroGame:
             if callable(handler):
                 self.handlers[type] = self.prepare_handler(handler)
 
+        # Mouse events are only consumed by handlers, so keep SDL from
+        # queueing the ones nobody listens for. Key events stay allowed as
+        # they also drive the keyboard state.
+        for type in self.MOUSE_EVENTS:
+            if type in self.handlers:
+                pygame.event.set_allowed(type)
+            else:
+                pygame.event.set_blocked(type)
+
     def prepare_handler(self, handler):
         code = handler.__code__
         param_names = code.co_varnames[:code.co_argcount]
@@ -118,19 +133,33 @@ class PGZeroGame:
         update = self.get_update_func()
         draw = self.get_draw_func()
         self.load_handlers()
+
+        # Bind everything the loop touches once, rather than per frame.
+        tick = clock.tick
+        get_events = pygame.event.get
+        keyboard = self.keyboard
+        dispatch_event = self.dispatch_event
+        clock_tick = pgzero.clock.tick
+        reinit_screen = self.reinit_screen
+        flip = pygame.display.flip
+        QUIT = pygame.QUIT
+        KEYDOWN = pygame.KEYDOWN
+        KEYUP = pygame.KEYUP
+
         while True:
-            dt = clock.tick(60) / 1000.0
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+            dt = tick(60) / 1000.0
+            for event in get_events():
+                type = event.type
+                if type == QUIT:
                     return
-                if event.type == pygame.KEYDOWN:
-                    self.keyboard[event.key] = True
-                elif event.type == pygame.KEYUP:
-                    self.keyboard[event.key] = False
-                self.dispatch_event(event)
+                if type == KEYDOWN:
+                    keyboard[event.key] = True
+                elif type == KEYUP:
+                    keyboard[event.key] = False
+                dispatch_event(event)
 
-            pgzero.clock.tick(dt)
+            clock_tick(dt)
             update(dt)
-            self.reinit_screen()
+            reinit_screen()
             draw()
-            pygame.display.flip()
+            flip()
@@ -9,6 +9,6 @@ class Main(heat2d.Stage):
         print("Main stage is initialized!")
 
     def update(self):
-        
+        pass
 
 engine.run()